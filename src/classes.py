@@ -1,20 +1,211 @@
-from langchain_chroma import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+# Heavy dependencies (langchain integrations, torch, chromadb, PDF parsers)
+# are imported inside the functions that use them, so the CLI menu
+# starts instantly and only pays for what the chosen action needs.
+from semantic_text_splitter import TextSplitter
 from dotenv import load_dotenv
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_groq import ChatGroq
-from langchain_core.prompts import (
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate,
-    ChatPromptTemplate
-)
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+import asyncio
+import functools
+import hashlib
+import json
+import numpy as np
 import os
+import uuid
 
 load_dotenv()
 # Loads environment variables from .env at import time.
-# NOTE: This does NOT validate whether required keys (like GROQ_API_KEY) exist.
-# Failure is deferred to LLM initialization later, which can slow debugging.
+# Required keys are validated right away, before any model is downloaded
+# or loaded, so a misconfigured .env fails fast.
+_REQUIRED_ENV = ("GROQ_API_KEY", "EMBEDDING_MODEL")
+_missing_env = [key for key in _REQUIRED_ENV if not os.environ.get(key)]
+if _missing_env:
+    raise RuntimeError(f"Missing environment variables: {', '.join(_missing_env)}")
+
+# Semantic answer cache settings.
+# A new question is answered from cache when its cosine similarity to a
+# previously answered question in the same session reaches this threshold.
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_MAX_ENTRIES = 1000
+
+# Fallback answer when a session or relevant context is missing.
+# Matches the wording the system prompt asks the LLM to use.
+NO_ANSWER = "I don't know. No relevant information found."
+
+# Minimum cosine similarity for a retrieved chunk to be sent to the LLM.
+RELEVANCE_THRESHOLD = 0.3
+
+# Exact-match answer cache size, keyed by (session_name, question).
+# Checked before the semantic cache so exact repeats skip embedding entirely.
+EXACT_CACHE_MAX_ENTRIES = 512
+
+# Session index file, plus the older line-based file it replaced.
+SESSIONS_FILE = "sessions.json"
+LEGACY_SESSIONS_FILE = "sessions.txt"
+
+# HNSW index settings for new Chroma collections.
+# Cosine space matches the normalized embeddings; M / construction_ef /
+# search_ef trade a slightly larger graph for faster, accurate search.
+HNSW_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64
+}
+
+# Chunking settings.
+# Chunks under MIN_CHUNK_SIZE are merged into a neighbour as long as the
+# result stays within MAX_MERGED_CHUNK_SIZE.
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 100
+MIN_CHUNK_SIZE = 100
+MAX_MERGED_CHUNK_SIZE = 550
+
+# Number of chunks embedded and written to Chroma per call during ingestion.
+EMBED_BATCH_SIZE = 128
+
+
+def _chunk_pages(document, splitter):
+    # Splits a loaded document (list of page Documents) into chunks.
+    # Each page is split separately; chunks are tracked as character spans
+    # (page_index, start, end) into the page text so merging can slice the
+    # original text instead of guessing where neighbouring chunks overlap.
+    spans = []
+    for page_index, page in enumerate(document):
+        for start, text in splitter.chunk_indices(page.page_content):
+            spans.append((page_index, start, start + len(text)))
+    return _merge_chunks(document, spans)
+
+
+def _join_segments(left, right):
+    # Joins two merged chunks, each a list of (page_index, start, end) spans.
+    # Spans from the same page are fused into one slice of the page text,
+    # which covers the splitter's overlap exactly once. Spans from different
+    # pages stay separate and are later joined with a newline.
+    page, left_start, _ = left[-1]
+    if right[0][0] == page:
+        return left[:-1] + [(page, left_start, right[0][2])] + right[1:]
+    return left + right
+
+
+def _segments_length(segments):
+    # Length of the text _segments_text would build, without building it.
+    return sum(end - start for _, start, end in segments) + len(segments) - 1
+
+
+def _segments_text(document, segments):
+    return "\n".join(
+        document[page].page_content[start:end] for page, start, end in segments
+    )
+
+
+def _merge_chunks(document, spans):
+    # Split-then-merge post-processing.
+    # Per-page splitting leaves many short tail chunks; each one costs an
+    # embedding and pollutes retrieval with context-poor fragments.
+    # Merged chunks keep the metadata of their first source page.
+    from langchain_core.documents import Document
+
+    # Pass 1: greedily pack adjacent chunks up to CHUNK_SIZE.
+    merged = []
+    for span in spans:
+        if merged:
+            joined = _join_segments(merged[-1], [span])
+            if _segments_length(joined) <= CHUNK_SIZE:
+                merged[-1] = joined
+                continue
+        merged.append([span])
+
+    # Pass 2: fold tiny leftovers into a neighbour, allowing slight overflow.
+    result = []
+    for segments in merged:
+        if result and (
+            _segments_length(segments) < MIN_CHUNK_SIZE
+            or _segments_length(result[-1]) < MIN_CHUNK_SIZE
+        ):
+            joined = _join_segments(result[-1], segments)
+            if _segments_length(joined) <= MAX_MERGED_CHUNK_SIZE:
+                result[-1] = joined
+                continue
+        result.append(segments)
+
+    # No re-split is needed: splitter output is at most CHUNK_SIZE, pass 1
+    # never exceeds CHUNK_SIZE and pass 2 never exceeds MAX_MERGED_CHUNK_SIZE.
+    return [
+        Document(
+            page_content=_segments_text(document, segments),
+            metadata=dict(document[segments[0][0]].metadata)
+        )
+        for segments in result
+    ]
+
+
+def _content_hash(text):
+    # Short content fingerprint used to skip duplicate chunks.
+    # blake2s is faster than sha1 in CPython's hashlib.
+    return hashlib.blake2s(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _load_pdf(docs_path):
+    # Loads a PDF as one Document per page.
+    # PyMuPDF (C-backed) is much faster than pypdf; pypdf's PyPDFLoader
+    # remains the fallback when PyMuPDF is missing or rejects the file.
+    # Metadata keys match PyPDFLoader ("source", "page").
+    from langchain_core.documents import Document
+
+    try:
+        import fitz
+        with fitz.open(docs_path) as pdf:
+            return [
+                Document(
+                    page_content=page.get_text("text"),
+                    metadata={"source": docs_path, "page": i}
+                )
+                for i, page in enumerate(pdf)
+            ]
+    except (ImportError, RuntimeError, ValueError):
+        # fitz.FileDataError (unsupported/damaged file) is a RuntimeError.
+        from langchain_community.document_loaders import PyPDFLoader
+        return PyPDFLoader(docs_path).load()
+
+
+def _load_and_chunk(docs_path):
+    # Loads one PDF and splits it into chunks.
+    # Top-level function so it can be pickled into ProcessPoolExecutor workers.
+    # No try/except: invalid path or corrupted PDF will crash execution.
+    splitter = TextSplitter(capacity=CHUNK_SIZE, overlap=CHUNK_OVERLAP)
+    document = _load_pdf(docs_path)
+    return _chunk_pages(document, splitter)
+
+
+def _l2_normalize(vectors):
+    # L2-normalizes a float32 vector, or each row of a float32 matrix.
+    # Done in float32 so bf16 model output is not normalized at low precision.
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_embedder(model_name):
+    # Module-level embedding engine cache, keyed by model name.
+    # Loading the encoder takes seconds, so every vectordb instance
+    # using the same model shares one loaded copy.
+    # On a GPU the weights are loaded directly in bfloat16 (no autocast);
+    # CPUs without native bf16 matmul are faster in float32, so they keep it.
+    # Normalization is left off here: sentence-transformers would normalize
+    # the bf16 tensor before converting it. Callers normalize the float32
+    # output instead (_l2_normalize), so cosine == dot product.
+    import torch
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    dtype = torch.bfloat16 if device == "cuda" else torch.float32
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={"device": device, "model_kwargs": {"torch_dtype": dtype}},
+        encode_kwargs={"batch_size": 64, "normalize_embeddings": False}
+    )
 
 
 class vectordb:
@@ -24,85 +215,115 @@ class vectordb:
         # existing Chroma collections become semantically incompatible.
         self.embedding_model_name = os.environ.get("EMBEDDING_MODEL")
 
-        # Embedding engine instance.
-        # This is reused across all collections.
-        self.embedding_engine = HuggingFaceEmbeddings(
-            model_name=self.embedding_model_name
-        )
-
         # Single persist directory for all Chroma collections.
         # All sessions live inside this folder.
         # Fine for a CLI project, risky for multi-user or multi-project setups.
         self.persist_directory = "./chroma_db"
 
         # In-memory registry of active sessions:
-        # session_name -> Chroma collection object
+        # session_name -> Chroma collection object, or None until first access
         # This dictionary is the runtime source of truth.
         self.collections = {}
 
-        # Text splitter configuration.
+        # Content hashes of stored chunks, per session.
+        # Loaded lazily from {persist_directory}/{session}.hashes.
+        self.seen_hashes = {}
+
+        # Text splitter configuration (native Rust splitter, character mode).
         # Chunk size and overlap are fixed.
+        # Splits recursively on semantic boundaries
+        # (paragraphs -> lines -> sentences -> words -> characters).
         # No adaptive behavior based on document type or length.
-        self.textsplitter = RecursiveCharacterTextSplitter(
-            chunk_size=500,
-            chunk_overlap=100,
-            separators=["\n\n", "\n", ".", " "]
-        )
+        self.textsplitter = TextSplitter(capacity=CHUNK_SIZE, overlap=CHUNK_OVERLAP)
+
+        # Persistent session index, mirrored from sessions.json.
+        self.session_index = {}
 
-        # Load previously created sessions from sessions.txt.
-        # This assumes sessions.txt is accurate and in sync with Chroma.
+        # Load previously created sessions from sessions.json.
+        # This assumes sessions.json is accurate and in sync with Chroma.
         self.load_all_sessions()
 
         print("Vector database initialized successfully.")
 
 
+    @property
+    def embedding_engine(self):
+        # Embedding engine instance, loaded on first use.
+        # Only _encode_batch (ingest) and RAGAssistant._embed_question (chat)
+        # read it; Chroma handles are opened without it.
+        # Shared process-wide with any other vectordb using the same model.
+        return _get_embedder(self.embedding_model_name)
+
+
     def load_all_sessions(self):
-        # If this is the first run, sessions.txt will not exist.
-        # Silent return means no feedback that the DB is empty by design.
-        if not os.path.exists("sessions.txt"):
+        # Session index is a single JSON dict: session_name -> {"created_at": ...}
+        # Loaded once here and kept in memory; writes go through
+        # _write_session_index.
+        if os.path.exists(SESSIONS_FILE):
+            with open(SESSIONS_FILE, "r") as f:
+                self.session_index = json.load(f)
+        elif os.path.exists(LEGACY_SESSIONS_FILE):
+            # One-time migration from the old line-based sessions.txt.
+            with open(LEGACY_SESSIONS_FILE, "r") as f:
+                names = [line.strip() for line in f if line.strip()]
+            self.session_index = {name: {"created_at": None} for name in names}
+            self._write_session_index()
+        else:
+            # If this is the first run, no index exists yet.
+            # Silent return means no feedback that the DB is empty by design.
             return
 
-        # Read session names line-by-line.
-        # Empty lines are ignored.
-        with open("sessions.txt", "r") as f:
-            session_names = [line.strip() for line in f if line.strip()]
-
-        # Recreate Chroma collection handles for each saved session.
+        # Register saved sessions without opening them.
+        # Chroma handles (and the embedding model) are created on first
+        # access in get_session, so startup cost does not grow with the
+        # number of sessions.
         # ASSUMPTIONS (not validated):
         # - Collection actually exists in Chroma
         # - Embedding model matches stored vectors
         # - Persist directory is intact
-        for name in session_names:
-            self.collections[name] = Chroma(
-                collection_name=name,
-                embedding_function=self.embedding_engine,
-                persist_directory=self.persist_directory
-            )
-
+        for name in self.session_index:
+            self.collections[name] = None
+
+
+    def _open_collection(self, session_name, collection_metadata=None):
+        # Opens (or creates) the Chroma collection for a session.
+        # Chroma uses get-or-create here, and some versions overwrite stored
+        # metadata when it differs. HNSW settings are therefore passed only
+        # when a session is created; existing sessions are opened without
+        # them so an old L2 collection is never relabelled as cosine.
+        # No embedding_function: ingest writes precomputed vectors and
+        # retrieval searches by vector, so Chroma never embeds anything.
+        # Opening a session (e.g. to delete it) thus never loads the model.
+        from langchain_chroma import Chroma
+
+        return Chroma(
+            collection_name=session_name,
+            persist_directory=self.persist_directory,
+            collection_metadata=collection_metadata
+        )
 
-    def _save_session_name(self, session_name):
-        # Appends session name to sessions.txt.
-        # No deduplication.
-        # If logic elsewhere fails, duplicate entries are possible.
-        with open("sessions.txt", "a") as f:
-            f.write(session_name + "\n")
 
+    def _write_session_index(self):
+        # Writes the whole index to a temp file, then atomically swaps it in.
+        # A crash mid-write leaves the previous index intact.
+        tmp_path = SESSIONS_FILE + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.session_index, f, indent=2)
+        os.replace(tmp_path, SESSIONS_FILE)
 
-    def _remove_session_name(self, session_name):
-        # Removes a session name from sessions.txt.
-        # Entire file is rewritten.
-        # Works for small scale, not concurrency-safe.
-        if not os.path.exists("sessions.txt"):
-            return
 
-        with open("sessions.txt", "r") as f:
-            names = [line.strip() for line in f if line.strip()]
+    def _save_session_name(self, session_name):
+        # Adds session to the index. Dict keys make duplicates impossible.
+        self.session_index[session_name] = {
+            "created_at": datetime.now().isoformat(timespec="seconds")
+        }
+        self._write_session_index()
 
-        names = [name for name in names if name != session_name]
 
-        with open("sessions.txt", "w") as f:
-            for name in names:
-                f.write(name + "\n")
+    def _remove_session_name(self, session_name):
+        # Removes session from the index; unknown names are ignored.
+        if self.session_index.pop(session_name, None) is not None:
+            self._write_session_index()
 
 
     def create_session(self, session_name):
@@ -114,10 +335,8 @@ class vectordb:
         if session_name in self.collections:
             return False  # session exists, do not create
         # Create new Chroma collection
-        self.collections[session_name] = Chroma(
-            collection_name=session_name,
-            embedding_function=self.embedding_engine,
-            persist_directory=self.persist_directory
+        self.collections[session_name] = self._open_collection(
+            session_name, collection_metadata=HNSW_COLLECTION_METADATA
         )
         # Persist the session name
         self._save_session_name(session_name)
@@ -126,7 +345,7 @@ class vectordb:
     def list_session(self):
         # Lists all session names currently loaded in memory.
         # Order depends on dictionary insertion order.
-        # This may not strictly reflect the order in sessions.txt.
+        # This may not strictly reflect the order in sessions.json.
         if self.collections is None:
             print("Session List is empty. First add some sessions.")
             return 
@@ -137,6 +356,12 @@ class vectordb:
         print("-------------------------")
 
 
+    def __contains__(self, session_name):
+        # Side-effect-free existence check: `name in db`.
+        # Prefer this over get_session when the collection object is not needed.
+        return session_name in self.collections
+
+
     def get_session(self, session_name):
         """
         Retrieve the Chroma collection for a given session name.
@@ -146,6 +371,8 @@ class vectordb:
         # This method also prints a warning, which may cause duplicated warnings
         # if caller prints its own error messages.
         if session_name in self.collections:
+            if self.collections[session_name] is None:
+                self.collections[session_name] = self._open_collection(session_name)
             return self.collections[session_name]
         else:
             print(f"[WARN] Session '{session_name}' does not exist.")
@@ -154,9 +381,9 @@ class vectordb:
 
     def chunk_document(self, document):
         # Splits a loaded document into chunks using predefined splitter.
-        # Thin wrapper function; mainly for readability and future extensibility.
-        chunks = self.textsplitter.split_documents(document)
-        return chunks
+        # Thin wrapper; the actual logic lives at module level so that
+        # worker processes in add_file can run it too.
+        return _chunk_pages(document, self.textsplitter)
 
 
     def add_file(self, documents_list, collection_name):
@@ -164,37 +391,130 @@ class vectordb:
         # documents_list is assumed to contain valid PDF file paths.
         
         # Retrieve target collection from in-memory registry.
-        collection = self.collections[collection_name]
+        collection = self.get_session(collection_name)
+
+        # Chunks from ALL documents are collected first,
+        # then embedded and stored in a few large batches.
+        all_chunks = []
+
+        # PDF parsing and chunking are CPU-bound and independent per file,
+        # so they run in separate processes (threads would serialize on the GIL).
+        # A single document is handled inline to avoid process start-up cost.
+        if len(documents_list) > 1:
+            workers = min(len(documents_list), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_load_and_chunk, documents_list))
+        else:
+            results = [_load_and_chunk(path) for path in documents_list]
 
-        for i, docs_path in enumerate(documents_list):
-            all_chunks = []
+        for i, chunks in enumerate(results):
+            all_chunks.extend(chunks)
+            print(f"Document no {i+1} loaded successfully.")
+
+        # Drop chunks whose content is already stored in this session
+        # (or repeated within this ingest), so re-adding a document
+        # costs no embeddings and creates no duplicates.
+        # The session's hash set is only updated once chunks are stored.
+        seen_hashes = self._get_seen_hashes(collection_name)
+        pending_hashes = set()
+        new_chunks = []
+        new_hashes = []
+        for chunk in all_chunks:
+            digest = _content_hash(chunk.page_content)
+            if digest in seen_hashes or digest in pending_hashes:
+                continue
+            pending_hashes.add(digest)
+            new_chunks.append(chunk)
+            new_hashes.append(digest)
+
+        skipped = len(all_chunks) - len(new_chunks)
+        if skipped:
+            print(f"Skipped {skipped} duplicate chunks.")
+        all_chunks = new_chunks
+
+        # Embed chunks ourselves and hand precomputed vectors straight to
+        # the underlying Chroma collection, skipping langchain's re-embedding.
+        # The next batch is encoded on a worker thread while the current one
+        # is written to Chroma (torch releases the GIL during inference).
+        batches = [
+            all_chunks[start:start + EMBED_BATCH_SIZE]
+            for start in range(0, len(all_chunks), EMBED_BATCH_SIZE)
+        ]
+        hash_batches = [
+            new_hashes[start:start + EMBED_BATCH_SIZE]
+            for start in range(0, len(new_hashes), EMBED_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._encode_batch, batches[0]) if batches else None
+            for i, batch in enumerate(batches):
+                embeddings = pending.result()
+                if i + 1 < len(batches):
+                    pending = executor.submit(self._encode_batch, batches[i + 1])
+                collection._collection.add(
+                    ids=[str(uuid.uuid4()) for _ in batch],
+                    embeddings=embeddings,
+                    documents=[chunk.page_content for chunk in batch],
+                    metadatas=[chunk.metadata for chunk in batch]
+                )
+
+                # Record this batch's hashes (in memory and in the side file)
+                # right after it is stored. If a later batch fails, a retry
+                # re-ingests exactly the chunks that never reached Chroma.
+                seen_hashes.update(hash_batches[i])
+                with open(self._hashes_path(collection_name), "a") as f:
+                    f.write("\n".join(hash_batches[i]) + "\n")
+
+        print(f"{len(all_chunks)} chunks added successfully.")
+
+
+    def _encode_batch(self, chunks):
+        # Encodes chunk texts with the underlying SentenceTransformer directly.
+        # langchain's embed_documents converts every vector to a Python list;
+        # here encode() batches internally and returns one numpy array.
+        # Vectors come back upcast to float32 and are normalized afterwards.
+        encoder = self.embedding_engine._client
+        embeddings = encoder.encode(
+            [chunk.page_content for chunk in chunks],
+            batch_size=EMBED_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=False,
+            show_progress_bar=False
+        )
+        return _l2_normalize(embeddings.astype(np.float32))
 
-            # Loads PDF file.
-            # No try/except: invalid path or corrupted PDF will crash execution.
-            loader = PyPDFLoader(docs_path)
-            document = loader.load()
 
-            # Split document into chunks.
-            chunks = self.chunk_document(document)
-            all_chunks.extend(chunks)
+    def _hashes_path(self, session_name):
+        # Side file listing content hashes of every chunk in the session.
+        return os.path.join(self.persist_directory, f"{session_name}.hashes")
 
-            # Add chunks to Chroma.
-            # No deduplication logic.
-            # Re-adding same document will duplicate embeddings.
-            collection.add_documents(all_chunks)
 
-            print(f"Document no {i+1} added successfully.")
+    def _get_seen_hashes(self, session_name):
+        # Loads the session's chunk hashes on first use and caches them.
+        if session_name not in self.seen_hashes:
+            hashes = set()
+            path = self._hashes_path(session_name)
+            if os.path.exists(path):
+                with open(path, "r") as f:
+                    hashes = {line.strip() for line in f if line.strip()}
+            self.seen_hashes[session_name] = hashes
+        return self.seen_hashes[session_name]
 
 
     def delete_session(self, session_name):
         # Deletes the entire Chroma collection permanently.
         # No confirmation step.
         # Irreversible operation.
-        self.collections[session_name].delete_collection()
+        self.get_session(session_name).delete_collection()
 
-        # Remove from sessions.txt persistence.
+        # Remove from sessions.json persistence.
         self._remove_session_name(session_name)
 
+        # Remove the chunk hash side file along with the collection.
+        hashes_path = self._hashes_path(session_name)
+        if os.path.exists(hashes_path):
+            os.remove(hashes_path)
+        self.seen_hashes.pop(session_name, None)
+
         # Remove from in-memory registry.
         del self.collections[session_name]
 
@@ -210,13 +530,18 @@ class RAGAssistant:
         - Prompt template
         """
         # Initialize LLM immediately.
-        # If GROQ_API_KEY is missing, program crashes here.
         self.llm = self._initialize_llm()
 
         # Store reference to vectordb instance.
         # Tight coupling: RAGAssistant assumes vectordb interface.
         self.vector_db = vector_database
 
+        from langchain_core.prompts import (
+            SystemMessagePromptTemplate,
+            HumanMessagePromptTemplate,
+            ChatPromptTemplate
+        )
+
         # System-level prompt defining behavior and strict grounding rules.
         system_msg = SystemMessagePromptTemplate.from_template(
         """You are StudyMate, a helpful educational assistant.
@@ -252,16 +577,26 @@ class RAGAssistant:
         # No memory, no tool usage, no retries at chain level.
         self.chain = self.prompt | self.llm
 
+        # Per-session semantic answer cache:
+        # session_name -> OrderedDict(question -> (normalized embedding, answer))
+        # OrderedDict order doubles as LRU order (oldest first).
+        # Lives in memory only; lost when the program exits.
+        self.answer_cache = {}
+
+        # Exact-match answer cache (tier 0):
+        # (session_name, question) -> answer, in LRU order.
+        self._l0 = OrderedDict()
+
+        # Event loop for query_many, created on first use and kept for the
+        # assistant's lifetime (see query_many).
+        self._loop = None
+
         print("[INFO] RAGAssistant initialized successfully.")
 
 
     def _initialize_llm(self):
-        # Fetch Groq API key from environment.
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            # Hard failure by design.
-            # Acceptable for CLI learning project.
-            raise ValueError("Groq API key not found in environment variables!")
+        # GROQ_API_KEY presence is checked at module import.
+        from langchain_groq import ChatGroq
 
         # Groq chat model configuration.
         return ChatGroq(
@@ -272,6 +607,115 @@ class RAGAssistant:
         )
 
 
+    def _embed_question(self, question):
+        # Embeds the question once and L2-normalizes it,
+        # so cosine similarity reduces to a plain dot product.
+        vec = np.asarray(
+            self.vector_db.embedding_engine.embed_query(question),
+            dtype=np.float32
+        )
+        return _l2_normalize(vec)
+
+
+    def _exact_lookup(self, session_name, question):
+        # Returns the answer for an identical earlier question, or None.
+        key = (session_name, question)
+        if key not in self._l0:
+            return None
+        self._l0.move_to_end(key)
+        return self._l0[key]
+
+
+    def _exact_store(self, session_name, question, answer):
+        key = (session_name, question)
+        self._l0[key] = answer
+        self._l0.move_to_end(key)
+        if len(self._l0) > EXACT_CACHE_MAX_ENTRIES:
+            self._l0.popitem(last=False)
+
+
+    def _semantic_lookup(self, session_name, q_emb):
+        # Returns a cached answer for a semantically similar question, or None.
+        cache = self.answer_cache.get(session_name)
+        if not cache:
+            return None
+
+        questions = list(cache.keys())
+        matrix = np.stack([cache[q][0] for q in questions])
+        scores = matrix @ q_emb
+        best = int(np.argmax(scores))
+        if scores[best] < SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        # Mark entry as recently used.
+        cache.move_to_end(questions[best])
+        return cache[questions[best]][1]
+
+
+    def _semantic_store(self, session_name, question, q_emb, answer):
+        # Stores the answer and evicts the least recently used entry when full.
+        cache = self.answer_cache.setdefault(session_name, OrderedDict())
+        cache[question] = (q_emb, answer)
+        cache.move_to_end(question)
+        if len(cache) > SEMANTIC_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+
+    def _retrieve(self, collection, q_emb, n_results):
+        # Top-k similarity search, keeping only chunks whose cosine
+        # similarity to the question reaches RELEVANCE_THRESHOLD.
+        # Dropping weak matches keeps the prompt, and thus LLM latency, small.
+        scored = collection.similarity_search_by_vector_with_relevance_scores(
+            q_emb.tolist(), k=n_results
+        )
+        # Chroma returns raw distances here; convert them to cosine similarity
+        # based on the collection's distance space. Vectors are normalized, so:
+        # - cosine / ip: distance = 1 - cos
+        # - l2 (sessions created before cosine was the default): Chroma
+        #   reports the squared distance, which is 2 - 2*cos
+        metadata = collection._collection.metadata or {}
+        if metadata.get("hnsw:space", "l2") == "l2":
+            to_cosine = lambda distance: 1.0 - distance / 2.0
+        else:
+            to_cosine = lambda distance: 1.0 - distance
+        return [doc for doc, distance in scored if to_cosine(distance) >= RELEVANCE_THRESHOLD]
+
+
+    def clear_cache(self, session_name):
+        # Drops cached answers for a session.
+        # Must be called whenever the session's documents change,
+        # otherwise stale answers may be returned.
+        self.answer_cache.pop(session_name, None)
+        for key in [k for k in self._l0 if k[0] == session_name]:
+            del self._l0[key]
+
+
+    def _semantic_hit(self, session_name, question, q_emb):
+        # Semantic cache lookup; a hit is also promoted to the exact cache.
+        cached = self._semantic_lookup(session_name, q_emb)
+        if cached is not None:
+            self._exact_store(session_name, question, cached)
+        return cached
+
+
+    def _prompt_inputs(self, session_name, question, docs):
+        # Combine retrieved chunks into a single context string.
+        # Metadata (page number, source file) is discarded.
+        # Prompt-variable mismatch here will raise runtime errors.
+        return {
+            "question": question,
+            "context": "\n\n".join(doc.page_content for doc in docs),
+            "session_name": session_name
+        }
+
+
+    def _remember(self, session_name, question, q_emb, answer):
+        # Stores a fresh LLM answer in both caches and returns it.
+        self._semantic_store(session_name, question, q_emb, answer)
+        self._exact_store(session_name, question, answer)
+        return answer
+
+
     def query(self, session_name: str, question: str, n_results: int = 5):
         """
         Retrieve relevant chunks from the vector DB for a session and
@@ -282,32 +726,91 @@ class RAGAssistant:
             question: User's question
             n_results: How many top chunks to retrieve
         """
+        # Exact repeats are answered without touching embeddings or Chroma.
+        cached = self._exact_lookup(session_name, question)
+        if cached is not None:
+            return cached
+
         # Retrieve collection from vector DB.
         collection = self.vector_db.get_session(session_name)
         if collection is None:
             # Defensive fallback if session does not exist.
-            return "I don't know. No relevant information found."
+            return NO_ANSWER
+
+        # Check semantic cache before doing any retrieval or LLM work.
+        # This single embedding drives both the cache lookup and retrieval.
+        q_emb = self._embed_question(question)
+        cached = self._semantic_hit(session_name, question, q_emb)
+        if cached is not None:
+            return cached
 
         # Perform similarity search in Chroma.
-        # No score threshold — low-relevance chunks may still be returned.
-        docs = collection.similarity_search(question, k=n_results)
+        # Reuses the cache-lookup embedding, so Chroma does not embed again.
+        docs = self._retrieve(collection, q_emb, n_results)
 
         if not docs:
-            # Explicit handling when no chunks are retrieved.
-            return "I don't know. No relevant information found."
+            # Explicit handling when no relevant chunks are retrieved.
+            return NO_ANSWER
 
-        # Combine retrieved chunks into a single context string.
-        # Metadata (page number, source file) is discarded.
-        context = "\n\n".join(doc.page_content for doc in docs)
+        # Invoke LLM, then remember the answer for similar future questions.
+        response = self.chain.invoke(self._prompt_inputs(session_name, question, docs))
+        return self._remember(session_name, question, q_emb, response.content)
 
-        # Invoke LLM with required prompt variables.
-        # Prompt-variable mismatch here will raise runtime errors.
-        response = self.chain.invoke({
-            "question": question,
-            "context": context,
-            "session_name": session_name
-        })
 
-        # Return plain text response.
-        return response.content
+    async def aquery(self, session_name: str, question: str, n_results: int = 5):
+        """
+        Async version of query().
+        Lets callers overlap several questions with asyncio.gather,
+        so N questions take roughly the slowest LLM round-trip, not the sum.
+
+        Args:
+            session_name: Name of the session/collection to query
+            question: User's question
+            n_results: How many top chunks to retrieve
+        """
+        cached = self._exact_lookup(session_name, question)
+        if cached is not None:
+            return cached
+
+        collection = self.vector_db.get_session(session_name)
+        if collection is None:
+            return NO_ANSWER
+
+        # Embedding and Chroma search are blocking; run them off the event loop.
+        q_emb = await asyncio.to_thread(self._embed_question, question)
+        cached = self._semantic_hit(session_name, question, q_emb)
+        if cached is not None:
+            return cached
+
+        docs = await asyncio.to_thread(self._retrieve, collection, q_emb, n_results)
+
+        if not docs:
+            return NO_ANSWER
+
+        response = await self.chain.ainvoke(self._prompt_inputs(session_name, question, docs))
+        return self._remember(session_name, question, q_emb, response.content)
+
+
+    def query_many(self, session_name: str, questions):
+        """
+        Ask several questions concurrently and return answers in order.
+        Always runs on this assistant's single event loop: the Groq async
+        client keeps connections bound to the loop it first ran on, so a
+        fresh asyncio.run() per call would reuse them on a closed loop.
+        """
+        async def gather_all():
+            return await asyncio.gather(
+                *(self.aquery(session_name, q) for q in questions)
+            )
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(gather_all())
+
 
+    def close(self):
+        # Shuts down the event loop used by query_many, if one was started.
+        if self._loop is not None:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+            self._loop = None
@@ -1,22 +1,53 @@
 import os
+import sys
 import time
 from classes import vectordb, RAGAssistant
 
-def clear_screen(delay: float = 2.0):
+def _enable_ansi():
     """
-    Clears the terminal screen.
+    Returns True if the terminal understands ANSI escape sequences.
+    Legacy Windows consoles need virtual-terminal processing switched on
+    first; if that fails, callers fall back to `cls`.
+    """
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+# Checked once at import; enabling VT mode persists for the console.
+_ANSI_SUPPORTED = _enable_ansi()
+
+def clear_screen(delay: float = 0.0):
+    """
+    Clears the terminal screen with ANSI escapes (no shell subprocess).
     Optional delay lets user read the last message before screen resets.
     """
     if delay > 0:
         time.sleep(delay)
 
-    os.system("cls" if os.name == "nt" else "clear")
+    if not _ANSI_SUPPORTED:
+        os.system("cls")
+        return
+
+    # Clear screen, then move cursor to top-left.
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 def create_session(db, assistant):
     """
     Loops until user enters a unique session name.
     Creates session when valid.
-    Clears screen after creation.
+    Screen is cleared by main() before the action starts, so the result
+    message stays visible above the next menu.
     """
     while True:
         session_name = input("Enter the session name (no space allowed. Only small letters): ").strip()
@@ -30,7 +61,6 @@ def create_session(db, assistant):
             break
         else:
             print(f"Session '{session_name}' already exists. Try a different name.\n")
-    clear_screen()
 
 
 def list_sessions(db, assistant):
@@ -42,7 +72,7 @@ def add_documents(db, assistant):
     
     while True:
         session_name = str(input("Write the session name to add documents (pdfs) in it: "))
-        if db.get_session(session_name) is None:
+        if session_name not in db:
             print("Session name not exist.")
             continue
         break
@@ -55,37 +85,48 @@ def add_documents(db, assistant):
         print("Document path added to bucket.")
     print("Adding Documents in the session.")
     db.add_file(documents_list, session_name)
+    # New documents may change answers; drop cached ones for this session.
+    # assistant is None until the first chat, in which case nothing is cached.
+    if assistant is not None:
+        assistant.clear_cache(session_name)
     print(f"All documents added to the {session_name} session.")
-    clear_screen()
  
 def start_chat(db, assistant):
     list_sessions(db, assistant)
     
     while True:
         session_name = str(input("Write the session name to start the chat: "))
-        if db.get_session(session_name) is None:
+        if session_name not in db:
             print("Session name not exist.")
             continue
         break
     
     while True:
-        question = str(input("Ask (or type quit to stop): "))
+        question = str(input("Ask (separate multiple questions with ;; or type quit to stop): "))
         if str.lower(question) == "quit":      
            print("Going back to main menu.")
            break
+        # Several questions separated by ";;" are asked concurrently.
+        questions = [q.strip() for q in question.split(";;") if q.strip()]
+        if len(questions) > 1:
+            # Total wait is the slowest answer, not the sum.
+            responses = assistant.query_many(session_name, questions)
+            for q, response in zip(questions, responses):
+                print(f"Q: {q}\nAnswer: {response}\n")
+            continue
         response = assistant.query(session_name, question)
         print(f"Answer: {response}")
-    clear_screen() # Call the function associated with the choice
 
 def delete_session(db, assistant):
     list_sessions(db, assistant)
     while True:
         session_name = str(input("Write the session name to delete that session: "))
-        if db.get_session(session_name) is None:
+        if session_name not in db:
             print("Session name not exist.")
             continue
         break
     db.delete_session(session_name)
-    clear_screen() # Call the function associated with the choice
+    if assistant is not None:
+        assistant.clear_cache(session_name)
 
     
\ No newline at end of file
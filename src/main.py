@@ -1,9 +1,6 @@
 from src.classes import vectordb, RAGAssistant
 from src.functions import create_session, add_documents, list_sessions, start_chat, delete_session, clear_screen
 
-db = vectordb()
-assistant = RAGAssistant(db)
-
 def print_menu():
     print("""
 StudyMate CLI Menu
@@ -26,6 +23,13 @@ COMMANDS = {
 }
 
 def main():
+    # Built inside main() rather than at import time: on platforms that
+    # spawn worker processes (Windows, macOS) this module is re-imported
+    # by every ingestion worker.
+    db = vectordb()
+    # The LLM client is only needed for chat; it is created on first use.
+    assistant = None
+
     print("Welcome to StudyMate")
     print("--------------------")
     while True:
@@ -33,15 +37,21 @@ def main():
         choice = input("Enter your choice: ").strip()
 
         if choice == "6":
+            if assistant is not None:
+                assistant.close()
             print("Exiting StudyMate. Goodbye!")
             break
 
         action = COMMANDS.get(choice)
         if action:
+            # Clear before the action rather than after it, so each action's
+            # result message stays on screen above the next menu.
+            clear_screen()
+            if choice == "4" and assistant is None:
+                assistant = RAGAssistant(db)
             action(db, assistant) 
         else:
             print("Invalid option. Please try again.")
-            clear_screen() # Call the function associated with the choice
 
 
 if __name__ == "__main__":